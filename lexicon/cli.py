@@ -1,16 +1,19 @@
 """Main CLI entry point using typer framework."""
 
 import typer
-import random as random_module
 import logging
-import click
-import csv
-import json
-from typing import Optional, List
+import random
+import re
+import sys
+from bisect import bisect_right
+from collections import defaultdict
+from itertools import islice
+from operator import itemgetter
+from typing import Optional, List, Sequence
 from pathlib import Path
-from dataclasses import asdict
+from dataclasses import fields
 from lexicon.search import SearchEngine
-from lexicon.models import Word
+from lexicon.models import Word, word_column
 
 try:
     import orjson
@@ -21,6 +24,18 @@ app = typer.Typer(help="Lexicon-Lab: A flexible Chinese word search CLI tool")
 
 _search_engine: Optional[SearchEngine] = None
 
+# CSV export columns
+CSV_FIELDNAMES = ("word", "pinyin", "definition", "category", "length")
+
+# Buffer for file exports and batch input, sized to cut syscalls on large files
+FILE_BUFFER_SIZE = 1 << 20
+
+# Text output longer than this (in characters) bypasses typer.echo
+LARGE_OUTPUT_THRESHOLD = 64 * 1024
+
+# Word field names, in declaration order, for JSON export
+WORD_FIELDNAMES = tuple(field.name for field in fields(Word))
+
 # Set up logging for error tracking
 logger = logging.getLogger(__name__)
 
@@ -54,6 +69,14 @@ def get_search_engine() -> SearchEngine:
     return _search_engine
 
 
+def _write_stdout_bytes(data: bytes) -> None:
+    """Write already-encoded UTF-8 output plus a newline straight to stdout's buffer."""
+    sys.stdout.flush()
+    sys.stdout.buffer.write(data)
+    sys.stdout.buffer.write(b"\n")
+    sys.stdout.buffer.flush()
+
+
 def _export_results(
     results: list[Word],
     format: str,
@@ -88,6 +111,27 @@ def _export_results(
         _export_csv(results, output_file)
 
 
+def _format_word_line(
+    number: int,
+    word: Word,
+    show_pinyin: bool = True,
+    show_definition: bool = True
+) -> str:
+    """Format one numbered result line: "1. 词语 [pinyin] - definition".
+    
+    Args:
+        number: 1-based position of the word in the listing
+        word: Word to format
+        show_pinyin: Whether to include pinyin
+        show_definition: Whether to include definition
+    """
+    return (
+        f"{number}. {word.word}"
+        f"{f' [{word.pinyin}]' if show_pinyin and word.pinyin else ''}"
+        f"{f' - {word.definition}' if show_definition and word.definition else ''}"
+    )
+
+
 def _export_text(
     results: list[Word],
     output_file: Optional[Path] = None,
@@ -102,28 +146,25 @@ def _export_text(
         no_pinyin: Whether to omit pinyin
         no_definition: Whether to omit definition
     """
-    lines = []
-    lines.append(f"找到 {len(results)} 条结果:\n")
+    show_pinyin = not no_pinyin
+    show_definition = not no_definition
     
-    for i, word in enumerate(results, 1):
-        line = f"{i}. {word.word}"
-        
-        if not no_pinyin and word.pinyin:
-            line += f" [{word.pinyin}]"
-        
-        if not no_definition and word.definition:
-            line += f" - {word.definition}"
-        
-        lines.append(line)
+    lines = [f"找到 {len(results)} 条结果:\n"]
+    lines.extend(
+        _format_word_line(i, word, show_pinyin, show_definition)
+        for i, word in enumerate(results, 1)
+    )
     
     output = "\n".join(lines)
     
     if output_file is None:
-        typer.echo(output)
+        if len(output) > LARGE_OUTPUT_THRESHOLD:
+            _write_stdout_bytes(output.encode('utf-8'))
+        else:
+            typer.echo(output)
     else:
         try:
-            with open(output_file, 'w', encoding='utf-8') as f:
-                f.write(output)
+            output_file.write_bytes(output.encode('utf-8'))
             typer.echo(f"✅ 结果已导出到: {output_file}")
         except IOError as e:
             typer.echo(f"❌ 错误：无法写入文件 {output_file}", err=True)
@@ -138,28 +179,38 @@ def _export_json(
 ) -> None:
     """Export results in JSON format.
     
-    Converts Word dataclasses to dictionaries and outputs as JSON array.
-    Uses orjson if available for better performance, falls back to json module.
+    Outputs Word dataclasses as a JSON array. Uses orjson if available, which
+    serializes dataclasses natively; otherwise builds flat dicts for the json module.
     
     Args:
         results: List of Word objects to export
         output_file: Path to output file, or None for stdout
     """
-    # Convert Word objects to dictionaries
-    results_dicts = [asdict(word) for word in results]
-    
     try:
         # Use orjson if available for better performance, otherwise use json
         if orjson is not None:
-            json_output = orjson.dumps(results_dicts, option=orjson.OPT_INDENT_2).decode('utf-8')
+            # orjson produces UTF-8 bytes; write them as-is instead of decoding to str
+            json_bytes = orjson.dumps(results, option=orjson.OPT_INDENT_2)
+            if output_file is None:
+                _write_stdout_bytes(json_bytes)
+            else:
+                with open(output_file, 'wb') as f:
+                    f.write(json_bytes)
         else:
-            json_output = json.dumps(results_dicts, ensure_ascii=False, indent=2)
+            import json
+
+            # Word is flat, so a shallow dict per word is enough (asdict deep-copies)
+            results_dicts = [
+                {name: getattr(word, name) for name in WORD_FIELDNAMES}
+                for word in results
+            ]
+            if output_file is None:
+                typer.echo(json.dumps(results_dicts, ensure_ascii=False, indent=2))
+            else:
+                with open(output_file, 'w', encoding='utf-8', buffering=FILE_BUFFER_SIZE) as f:
+                    json.dump(results_dicts, f, ensure_ascii=False, indent=2)
         
-        if output_file is None:
-            typer.echo(json_output)
-        else:
-            with open(output_file, 'w', encoding='utf-8') as f:
-                f.write(json_output)
+        if output_file is not None:
             typer.echo(f"✅ 结果已导出到: {output_file}")
     except (IOError, OSError) as e:
         typer.echo(f"❌ 错误：无法写入文件 {output_file}", err=True)
@@ -173,6 +224,23 @@ def _export_json(
         raise typer.Exit(code=1)
 
 
+def _write_csv(stream, results: list[Word]) -> None:
+    """Write results as CSV rows to a text stream.
+    
+    Args:
+        stream: Writable text stream
+        results: List of Word objects to write
+    """
+    import csv
+
+    writer = csv.writer(stream, quoting=csv.QUOTE_MINIMAL, escapechar='\\')
+    writer.writerow(CSV_FIELDNAMES)
+    writer.writerows(
+        (word.word, word.pinyin or "", word.definition or "", word.category or "", word.length)
+        for word in results
+    )
+
+
 def _export_csv(
     results: list[Word],
     output_file: Optional[Path] = None
@@ -186,44 +254,11 @@ def _export_csv(
         output_file: Path to output file, or None for stdout
     """
     try:
-        # CSV headers
-        fieldnames = ["word", "pinyin", "definition", "category", "length"]
-        
         if output_file is None:
-            # Write to stdout
-            writer = csv.DictWriter(
-                click.get_text_stream('stdout'),
-                fieldnames=fieldnames,
-                quoting=csv.QUOTE_MINIMAL,
-                escapechar='\\'
-            )
-            writer.writeheader()
-            for word in results:
-                writer.writerow({
-                    "word": word.word,
-                    "pinyin": word.pinyin or "",
-                    "definition": word.definition or "",
-                    "category": word.category or "",
-                    "length": word.length
-                })
+            _write_csv(sys.stdout, results)
         else:
-            # Write to file
-            with open(output_file, 'w', encoding='utf-8', newline='') as f:
-                writer = csv.DictWriter(
-                    f,
-                    fieldnames=fieldnames,
-                    quoting=csv.QUOTE_MINIMAL,
-                    escapechar='\\'
-                )
-                writer.writeheader()
-                for word in results:
-                    writer.writerow({
-                        "word": word.word,
-                        "pinyin": word.pinyin or "",
-                        "definition": word.definition or "",
-                        "category": word.category or "",
-                        "length": word.length
-                    })
+            with open(output_file, 'w', encoding='utf-8', newline='', buffering=FILE_BUFFER_SIZE) as f:
+                _write_csv(f, results)
             typer.echo(f"✅ 结果已导出到: {output_file}")
     except IOError as e:
         typer.echo(f"❌ 错误：无法写入文件 {output_file}", err=True)
@@ -322,44 +357,39 @@ def chain(start_char: str = typer.Argument(..., help="起始字"), count: int =
         
         engine = get_search_engine()
         
-        idioms_with_start = engine.search(regex=f"^{start_char}", category="成语", limit=1)
-        if not idioms_with_start:
-            typer.echo(f"无法找到从 '{start_char}' 开始的成语")
-            raise typer.Exit(code=0)
-        
         result_chain = [start_char]
         current_char = start_char
+        idioms_by_first_char = engine.idioms_by_first_char
         
         for i in range(count):
             try:
-                idioms_with_start = engine.search(regex=f"^{current_char}", category="成语", limit=100)
+                idioms_with_start = idioms_by_first_char.get(current_char, [])
                 
                 if not idioms_with_start:
+                    if i == 0:
+                        typer.echo(f"无法找到从 '{start_char}' 开始的成语")
+                        raise typer.Exit(code=0)
                     typer.echo(f"\n⚠️  链断了！找不到以「{current_char}」开头的成语")
                     break
                 
-                best_idiom = None
-                best_followers_count = 0
-                
-                for idiom in idioms_with_start:
-                    try:
-                        followers = engine.search(regex=f"^{idiom.last_char}", category="成语")
-                        followers_count = len(followers)
-                        
-                        if followers_count > best_followers_count:
-                            best_followers_count = followers_count
-                            best_idiom = idiom
-                    except Exception as e:
-                        logger.warning(f"Error checking followers for {idiom.word}: {e}")
-                        continue
+                # Weight each candidate by how many idioms can follow it, so the
+                # chain favours continuable idioms without always picking the same one
+                followers_counts = [
+                    len(idioms_by_first_char.get(idiom.last_char, ()))
+                    for idiom in idioms_with_start
+                ]
                 
-                if best_idiom is None:
+                if not any(followers_counts):
                     typer.echo(f"\n⚠️  链断了！没有可选的成语")
                     break
                 
+                best_idiom = random.choices(idioms_with_start, weights=followers_counts)[0]
+                
                 result_chain.append(best_idiom.word)
                 current_char = best_idiom.last_char
             
+            except typer.Exit:
+                raise
             except Exception as e:
                 typer.echo(f"\n⚠️  在第 {i+1} 步出错：{str(e)}", err=True)
                 logger.warning(f"Error during chain generation at step {i+1}: {e}")
@@ -390,7 +420,7 @@ def define(word: str = typer.Argument(..., help="要查询的词语")) -> None:
         engine = get_search_engine()
         
         try:
-            results = engine.search(regex=f"^{word}$")
+            results = engine.search(exact=word)
         except Exception as e:
             typer.echo(f"❌ 错误：搜索失败 - {str(e)}", err=True)
             logger.warning(f"Search failed for word '{word}': {e}")
@@ -446,13 +476,7 @@ def random_word(length: Optional[int] = typer.Option(None, "-l", "--length", hel
         
         engine = get_search_engine()
         
-        candidates = list(range(len(engine.words)))
-        
-        if length is not None:
-            candidates = [idx for idx in candidates if engine.words[idx].length == length]
-        
-        if category is not None:
-            candidates = [idx for idx in candidates if engine.words[idx].category == category]
+        candidates = engine.word_indices(category=category, length=length)
         
         if not candidates:
             typer.echo("未找到匹配的词语")
@@ -461,7 +485,7 @@ def random_word(length: Optional[int] = typer.Option(None, "-l", "--length", hel
             return
         
         try:
-            selected_idx = random_module.choice(candidates)
+            selected_idx = random.choice(candidates)
             word = engine.words[selected_idx]
         except Exception as e:
             typer.echo(f"❌ 错误：无法选择随机词语", err=True)
@@ -504,35 +528,33 @@ def stats() -> None:
         
         total_words = len(engine.words)
         
-        by_category = {}
-        for word in engine.words:
-            category = word.category
-            by_category[category] = by_category.get(category, 0) + 1
+        by_category = {category: len(indices) for category, indices in index.by_category.items()}
         
         if not by_category:
             typer.echo("❌ 错误：无法统计词语分类", err=True)
             raise typer.Exit(code=1)
         
-        typer.echo("\n📊 词库统计：")
-        typer.echo(f"   总词语数: {total_words}")
-        
-        typer.echo("\n   按类型分类:")
-        for category, count in sorted(by_category.items()):
-            typer.echo(f"      {category}: {count}")
+        lines = [
+            "\n📊 词库统计：",
+            f"   总词语数: {total_words}",
+            "\n   按类型分类:",
+        ]
+        for category, count in sorted(by_category.items(), key=itemgetter(0)):
+            lines.append(f"      {category}: {count}")
         
         top_5_first = index.char_freq_start.most_common(5)
         if top_5_first:
-            typer.echo("\n   最常见的首字 (Top 5):")
-            for char, count in top_5_first:
-                typer.echo(f"      {char}: {count}")
+            lines.append("\n   最常见的首字 (Top 5):")
+            lines.extend(f"      {char}: {count}" for char, count in top_5_first)
         
         top_5_last = index.char_freq_end.most_common(5)
         if top_5_last:
-            typer.echo("\n   最常见的尾字 (Top 5):")
-            for char, count in top_5_last:
-                typer.echo(f"      {char}: {count}")
+            lines.append("\n   最常见的尾字 (Top 5):")
+            lines.extend(f"      {char}: {count}" for char, count in top_5_last)
         
-        typer.echo()
+        # One write for the whole report instead of one echo per line
+        lines.append("")
+        typer.echo("\n".join(lines))
     
     except typer.Exit:
         raise
@@ -556,11 +578,7 @@ def quiz(
         
         engine = get_search_engine()
         
-        candidates = list(range(len(engine.words)))
-        if length is not None:
-            candidates = [idx for idx in candidates if engine.words[idx].length == length]
-        if category is not None:
-            candidates = [idx for idx in candidates if engine.words[idx].category == category]
+        candidates = engine.word_indices(category=category, length=length)
         
         if not candidates:
             typer.echo("❌ 错误：未找到匹配的词语")
@@ -569,7 +587,7 @@ def quiz(
             raise typer.Exit(code=1)
         
         try:
-            selected_idx = random_module.choice(candidates)
+            selected_idx = random.choice(candidates)
             word_obj = engine.words[selected_idx]
         except Exception as e:
             typer.echo(f"❌ 错误：无法选择随机词语", err=True)
@@ -621,14 +639,13 @@ def quiz(
                         word_length = len(answer)
                         typer.echo(f"   提示: 长度是 {word_length} 字")
                         
-                        char_positions = {}
-                        for i, char in enumerate(answer):
-                            if char not in char_positions:
-                                char_positions[char] = []
-                            char_positions[char].append(i + 1)
-                        
-                        repeated_chars = {char: pos for char, pos in char_positions.items() if len(pos) > 1}
-                        if repeated_chars:
+                        # Most answers have no repeated characters; skip the position scan then
+                        if len(set(answer)) != word_length:
+                            char_positions = defaultdict(list)
+                            for i, char in enumerate(answer, 1):
+                                char_positions[char].append(i)
+                            
+                            repeated_chars = {char: pos for char, pos in char_positions.items() if len(pos) > 1}
                             hints = []
                             for char, positions in repeated_chars.items():
                                 hints.append(f"「{char}」出现在第 {', '.join(map(str, positions))} 位")
@@ -651,6 +668,41 @@ def quiz(
         raise typer.Exit(code=1)
 
 
+# fill wildcards to regex in one pass: ? -> one char, * -> any run of chars
+_FILL_WILDCARD_TABLE = str.maketrans({"?": ".", "*": ".*"})
+
+
+def _fill_fixed_length(
+    engine: SearchEngine,
+    pattern: str,
+    category: Optional[str],
+    limit: int
+) -> list[Word]:
+    """Match a fill pattern without * by comparing its known characters.
+    
+    Only words of the pattern's length (and category) are checked, so no regex
+    is compiled or run.
+    
+    Args:
+        engine: Search engine to look words up in
+        pattern: Pattern of literal characters and ? placeholders (e.g. 一?一?)
+        category: Word category filter, or None for any
+        limit: Maximum results (0 = unlimited)
+    
+    Returns:
+        Matching Word objects in index order
+    """
+    fixed = [(pos, char) for pos, char in enumerate(pattern) if char != "?"]
+    word_texts = word_column(engine.words, "word")
+    matches = (
+        idx
+        for idx in engine.word_indices(category=category, length=len(pattern))
+        if all(word_texts[idx][pos] == char for pos, char in fixed)
+    )
+    indices = list(islice(matches, limit)) if limit > 0 else list(matches)
+    return [engine.words[idx] for idx in indices]
+
+
 @app.command()
 def fill(
     pattern: str = typer.Argument(..., help="填字模式，使用 ? 表示待填字符 (如: 一?一?)"),
@@ -675,17 +727,19 @@ def fill(
         
         engine = get_search_engine()
         
-        # Convert wildcard pattern to regex
-        regex_pattern = pattern.replace("?", ".").replace("*", ".*")
-        regex_pattern = f"^{regex_pattern}$"
-        
         # Search for matching words
         try:
-            results = engine.search(
-                regex=regex_pattern,
-                category=category,
-                limit=limit
-            )
+            if "*" not in pattern and all(char == "?" or char.isalnum() for char in pattern):
+                results = _fill_fixed_length(engine, pattern, category, limit)
+            else:
+                # Convert wildcard pattern to regex
+                regex_pattern = f"^{pattern.translate(_FILL_WILDCARD_TABLE)}$"
+                
+                results = engine.search(
+                    regex=regex_pattern,
+                    category=category,
+                    limit=limit
+                )
         except ValueError as e:
             typer.echo(f"❌ 错误：无效的搜索参数", err=True)
             typer.echo(f"   {str(e)}", err=True)
@@ -715,8 +769,7 @@ def fill(
             
             # Pick a random word from results
             try:
-                selected_idx = random_module.choice(range(len(results)))
-                answer_word = results[selected_idx]
+                answer_word = random.choice(results)
             except Exception as e:
                 typer.echo(f"❌ 错误：无法选择随机词语", err=True)
                 typer.echo(f"   {str(e)}", err=True)
@@ -779,15 +832,7 @@ def fill(
             return
         
         # Case 4: More than 10 matches - just list them
-        typer.echo(f"\n找到 {result_count} 条结果:\n")
-        for i, word in enumerate(results, 1):
-            line = f"{i}. {word.word}"
-            if word.pinyin:
-                line += f" [{word.pinyin}]"
-            if word.definition:
-                line += f" - {word.definition}"
-            typer.echo(line)
-        typer.echo()
+        _export_text(results)
     
     except typer.Exit:
         raise
@@ -803,18 +848,25 @@ def init() -> None:
     typer.echo("init command - Not implemented yet")
 
 
+# CJK ideograph ranges (inclusive), sorted by start code point
+_CJK_RANGES = (
+    (0x3400, 0x4DBF),
+    (0x4E00, 0x9FFF),
+    (0x20000, 0x2A6DF),
+    (0x2A700, 0x2B73F),
+    (0x2B740, 0x2B81F),
+    (0x2B820, 0x2CEAF),
+    (0x2CEB0, 0x2EBEF),
+)
+_CJK_STARTS = tuple(start for start, _ in _CJK_RANGES)
+_CJK_ENDS = tuple(end for _, end in _CJK_RANGES)
+
+
 def _is_chinese_character(char: str) -> bool:
     """Check if character is valid Chinese character (CJK)."""
     code_point = ord(char)
-    return (
-        (0x4E00 <= code_point <= 0x9FFF) or
-        (0x3400 <= code_point <= 0x4DBF) or
-        (0x20000 <= code_point <= 0x2A6DF) or
-        (0x2A700 <= code_point <= 0x2B73F) or
-        (0x2B740 <= code_point <= 0x2B81F) or
-        (0x2B820 <= code_point <= 0x2CEAF) or
-        (0x2CEB0 <= code_point <= 0x2EBEF)
-    )
+    i = bisect_right(_CJK_STARTS, code_point) - 1
+    return i >= 0 and code_point <= _CJK_ENDS[i]
 
 
 @app.command()
@@ -864,11 +916,11 @@ def fly(
         }
         
         if position == "start":
-            search_kwargs["start"] = char
+            search_kwargs["prefix"] = char
         elif position == "end":
-            search_kwargs["end"] = char
+            search_kwargs["suffix"] = char
         else:
-            search_kwargs["contains"] = [char]
+            search_kwargs["contains"] = char
         
         try:
             results = engine.search(**search_kwargs)
@@ -890,20 +942,10 @@ def fly(
         else:
             header = f"找到 {result_count} 条包含'{char}'的词语"
         
-        typer.echo(f"\n{header}:\n")
-        
-        for i, word in enumerate(results, 1):
-            line = f"{i}. {word.word}"
-            
-            if word.pinyin:
-                line += f" [{word.pinyin}]"
-            
-            if word.definition:
-                line += f" - {word.definition}"
-            
-            typer.echo(line)
-        
-        typer.echo()
+        lines = [f"\n{header}:\n"]
+        lines.extend(_format_word_line(i, word) for i, word in enumerate(results, 1))
+        lines.append("")
+        typer.echo("\n".join(lines))
     
     except typer.Exit:
         raise
@@ -914,6 +956,40 @@ def fly(
         raise typer.Exit(code=1)
 
 
+# Queries without any of these are plain words and can skip the regex scan
+_REGEX_METACHARS = frozenset(".^$*+?{}[]\\|()")
+
+# Matches kept per regex batch line (the search command's default page size)
+BATCH_MATCH_LIMIT = 20
+
+
+def _scan_batch_patterns(words: Sequence[Word], patterns: list[re.Pattern], limit: int) -> list[list[Word]]:
+    """Match several compiled patterns against the lexicon in a single pass.
+    
+    Each pattern stops being tested once it has `limit` matches, and the
+    scan ends as soon as every pattern is full.
+    
+    Args:
+        words: Words to scan, in index order
+        patterns: Compiled regexes, one per batch line
+        limit: Maximum matches collected per pattern
+    
+    Returns:
+        Matching words for each pattern, in the same order as patterns
+    """
+    matches: list[list[int]] = [[] for _ in patterns]
+    active = [(pattern.search, bucket) for pattern, bucket in zip(patterns, matches)]
+    for idx, text in enumerate(word_column(words, "word")):
+        if not active:
+            break
+        full = False
+        for search, bucket in active:
+            if search(text):
+                bucket.append(idx)
+                full = full or len(bucket) >= limit
+        if full:
+            active = [(search, bucket) for search, bucket in active if len(bucket) < limit]
+    return [[words[idx] for idx in bucket] for bucket in matches]
 
 
 @app.command()
@@ -936,47 +1012,56 @@ def batch(
         
         engine = get_search_engine()
         
-        # Read input file
+        # Read and filter the input file in one streaming pass
+        queries = []
         try:
-            with open(input_file, 'r', encoding='utf-8') as f:
-                lines = f.readlines()
+            with open(input_file, 'r', encoding='utf-8', buffering=FILE_BUFFER_SIZE) as f:
+                for line in f:
+                    line = line.strip()
+                    # Skip empty lines and comments
+                    if line and not line.startswith('#'):
+                        queries.append(line)
         except IOError as e:
             typer.echo(f"❌ 错误：无法读取文件 {input_file}", err=True)
             typer.echo(f"   {str(e)}", err=True)
             logger.exception(f"Failed to read input file {input_file}")
             raise typer.Exit(code=1)
         
-        # Filter and clean lines
-        queries = []
-        for line in lines:
-            line = line.strip()
-            # Skip empty lines and comments
-            if line and not line.startswith('#'):
-                queries.append(line)
-        
         if not queries:
             typer.echo("❌ 错误：输入文件为空", err=True)
             raise typer.Exit(code=1)
         
-        # Process each query
-        all_results: dict[str, Word] = {}  # Use dict to deduplicate by word text
-        processed_count = 0
-        
-        for query in queries:
-            try:
-                results = engine.search(regex=f"^{query}$")
-                for word in results:
-                    # Deduplicate by word text
-                    if word.word not in all_results:
-                        all_results[word.word] = word
-            except Exception as e:
-                logger.warning(f"Search failed for query '{query}': {e}")
-                # Continue processing other queries even if one fails
-                continue
-            processed_count += 1
-        
-        # Convert dict to list for export
-        results_list = list(all_results.values())
+        # Compile every regex line up front so the lexicon is scanned once for
+        # all of them; literal lines are answered from the word index
+        regex_lines: dict[int, re.Pattern] = {}
+        for position, query in enumerate(queries):
+            if not _REGEX_METACHARS.isdisjoint(query):
+                try:
+                    regex_lines[position] = re.compile(f"^{query}$")
+                except re.error as e:
+                    logger.warning(f"Invalid regex pattern '{query}': {e}")
+        
+        scanned = dict(zip(
+            regex_lines,
+            _scan_batch_patterns(engine.words, list(regex_lines.values()), BATCH_MATCH_LIMIT),
+        ))
+        
+        # Merge per-line results in input order, deduplicating by word text
+        seen: set[str] = set()
+        results_list: list[Word] = []
+        by_word = engine.index.by_word
+        for position, query in enumerate(queries):
+            if _REGEX_METACHARS.isdisjoint(query):
+                # Literal query: an anchored regex could only match the word itself
+                indices = by_word.get(query)
+                matched = [engine.words[indices[0]]] if indices else []
+            else:
+                matched = scanned.get(position, [])
+            for word in matched:
+                if word.word not in seen:
+                    seen.add(word.word)
+                    results_list.append(word)
+        processed_count = len(queries)
         
         # Export results
         try:
@@ -1041,11 +1126,10 @@ def freq(
             typer.echo("未找到任何字频数据")
             return
         
-        typer.echo(f"\n{header}")
-        for char, count in top_chars:
-            typer.echo(f"   {char}: {count}")
-        
-        typer.echo()
+        lines = [f"\n{header}"]
+        lines.extend(f"   {char}: {count}" for char, count in top_chars)
+        lines.append("")
+        typer.echo("\n".join(lines))
     
     except typer.Exit:
         raise
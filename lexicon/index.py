@@ -1,26 +1,130 @@
 """Fast lookup indexes for Chinese word database."""
 
+from array import array
 from collections import Counter, defaultdict
-from lexicon.models import Word
+from collections.abc import Iterator, Sequence
+from functools import cached_property, partial
+from itertools import accumulate, chain
+import re
+from lexicon.models import Word, word_column
+
+
+_HANZI_RANGES = (
+    (0x4E00, 0x9FFF),
+    (0x3400, 0x4DBF),
+    (0x20000, 0x2A6DF),
+    (0x2A700, 0x2B73F),
+    (0x2B740, 0x2B81F),
+    (0x2B820, 0x2CEAF),
+    (0x2CEB0, 0x2EBEF),
+    (0xF900, 0xFAFF),
+    (0x2F800, 0x2FA1F),
+)
+
+
+def _build_hanzi_bitmap() -> bytearray:
+    """Build a one-bit-per-codepoint table covering all of Unicode."""
+    bitmap = bytearray(0x110000 >> 3)
+    for start, end in _HANZI_RANGES:
+        # Whole bytes in the middle of a range are set in one slice; only the
+        # ragged edges need per-bit updates
+        first_full = (start + 7) >> 3
+        last_full = (end + 1) >> 3
+        for code_point in range(start, min(first_full << 3, end + 1)):
+            bitmap[code_point >> 3] |= 1 << (code_point & 7)
+        for code_point in range(max(last_full << 3, start), end + 1):
+            bitmap[code_point >> 3] |= 1 << (code_point & 7)
+        if last_full > first_full:
+            bitmap[first_full:last_full] = b"\xff" * (last_full - first_full)
+    return bitmap
+
+
+_HANZI_BITMAP = _build_hanzi_bitmap()
+
+
+# Empty posting list factory: int32 ids (4 bytes each instead of a boxed int)
+_new_postings = partial(array, 'i')
+
+_SET_BIT = re.compile('1')
+
+
+def postings_to_bitmap(indices) -> int:
+    """Pack a posting list into an int with bit ``idx`` set for each index."""
+    bits = bytearray((max(indices) >> 3) + 1) if len(indices) else bytearray()
+    for idx in indices:
+        bits[idx >> 3] |= 1 << (idx & 7)
+    return int.from_bytes(bits, 'little')
+
+
+def _pack_postings(postings: dict) -> tuple[list, array, array]:
+    """Flatten a posting dict into its keys, all postings back to back, and end offsets."""
+    flat = _new_postings()
+    ends = _new_postings()
+    for indices in postings.values():
+        flat.extend(indices)
+        ends.append(len(flat))
+    return list(postings), flat, ends
+
+
+def _unpack_postings(keys: list, flat: array, ends: array) -> dict:
+    """Rebuild a posting dict flattened by _pack_postings."""
+    return {key: flat[start:end] for key, start, end in zip(keys, chain((0,), ends), ends)}
+
+
+def join_texts(texts: list[str]) -> tuple[str, array] | None:
+    """Join texts with newlines, returning the blob and each text's start offset.
+    
+    The offsets carry one extra entry past the end so text ``i`` spans
+    ``blob[starts[i]:starts[i + 1] - 1]``. Returns None if a text contains a
+    newline itself, since offsets could then no longer be told apart.
+    """
+    blob = '\n'.join(texts)
+    if blob.count('\n') != max(len(texts) - 1, 0):
+        return None
+    starts = array('i', [0])
+    starts.extend(accumulate(len(text) + 1 for text in texts))
+    return blob, starts
+
+
+def bitmap_to_indices(bitmap: int) -> list[int]:
+    """Ascending indices of the set bits in a bitmap."""
+    # bin() renders the bits in C; reversing puts bit 0 first so match
+    # offsets are the indices
+    return [match.start() for match in _SET_BIT.finditer(bin(bitmap)[:1:-1])]
+
+
+def iter_bitmap(bitmap: int) -> Iterator[int]:
+    """Lazily yield the indices of the set bits in a bitmap, ascending."""
+    return (match.start() for match in _SET_BIT.finditer(bin(bitmap)[:1:-1]))
 
 
 class LexiconIndex:
     """Provides fast lookups for Chinese words using multiple indexes."""
     
-    def __init__(self, words: list[Word]):
+    # Attributes holding {key: postings} dicts
+    POSTING_INDEXES = (
+        'by_word', 'by_first_char', 'by_last_char', 'by_char', 'by_pinyin_initials',
+        'by_pinyin_no_tone', 'by_rhyme', 'by_length', 'by_category', 'by_structure', 'by_tones',
+    )
+    
+    # Low-cardinality indexes whose postings cover large slices of the
+    # lexicon; these are also kept as bitmaps so filters combine with `&`
+    BITMAP_INDEXES = ('by_category', 'by_length', 'by_structure', 'by_rhyme')
+    
+    def __init__(self, words: Sequence[Word]):
         self.words = words
         
-        self.by_first_char: dict[str, list[int]] = {}
-        self.by_last_char: dict[str, list[int]] = {}
-        self.by_char: dict[str, list[int]] = {}
-        self.by_pinyin_initials: dict[str, list[int]] = {}
-        self.by_pinyin_no_tone: dict[str, list[int]] = {}
-        self.by_rhyme: dict[str, list[int]] = {}
-        self.by_length: dict[int, list[int]] = {}
-        self.by_category: dict[str, list[int]] = {}
-        self.by_structure: dict[str, list[int]] = {}
-        self.by_char_pinyin: dict[str, set[str]] = {}
-        self.by_similar_pinyin: dict[str, set[str]] = {}
+        self.by_word: dict[str, array] = {}
+        self.by_first_char: dict[str, array] = {}
+        self.by_last_char: dict[str, array] = {}
+        self.by_char: dict[str, array] = {}
+        self.by_pinyin_initials: dict[str, array] = {}
+        self.by_pinyin_no_tone: dict[str, array] = {}
+        self.by_rhyme: dict[str, array] = {}
+        self.by_length: dict[int, array] = {}
+        self.by_category: dict[str, array] = {}
+        self.by_structure: dict[str, array] = {}
+        self.by_tones: dict[str, array] = {}
         
         self.char_freq_start: Counter = Counter()
         self.char_freq_end: Counter = Counter()
@@ -28,67 +132,79 @@ class LexiconIndex:
         
         self._build_indexes()
     
+    def __getstate__(self) -> dict:
+        # The words are pickled once by the owner of the index, which
+        # reattaches them after loading
+        state = self.__dict__.copy()
+        state.pop('words', None)
+        
+        # Posting dicts go out as one flat array each: unpickling hundreds of
+        # thousands of tiny arrays is most of the cost of loading the index
+        packed = dict(state.pop('_packed', {}))
+        for name in self.POSTING_INDEXES:
+            if name in state:
+                packed[name] = _pack_postings(state.pop(name))
+        state['_packed'] = packed
+        return state
+    
+    def __getattr__(self, name: str):
+        # Only reached for missing attributes: unpack a posting index that is
+        # still in its pickled form on first use
+        packed = self.__dict__.get('_packed')
+        if not packed or name not in packed:
+            raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+        postings = _unpack_postings(*packed.pop(name))
+        setattr(self, name, postings)
+        return postings
+    
     @staticmethod
     def _is_chinese_char(char: str) -> bool:
         if not char or len(char) != 1:
             return False
         code_point = ord(char)
-        return (
-            (0x4E00 <= code_point <= 0x9FFF) or
-            (0x3400 <= code_point <= 0x4DBF) or
-            (0x20000 <= code_point <= 0x2A6DF) or
-            (0x2A700 <= code_point <= 0x2B73F) or
-            (0x2B740 <= code_point <= 0x2B81F) or
-            (0x2B820 <= code_point <= 0x2CEAF) or
-            (0x2CEB0 <= code_point <= 0x2EBEF) or
-            (0xF900 <= code_point <= 0xFAFF) or
-            (0x2F800 <= code_point <= 0x2FA1F)
-        )
+        return bool(_HANZI_BITMAP[code_point >> 3] & (1 << (code_point & 7)))
     
     def _build_indexes(self) -> None:
-        from lexicon.pinyin_utils import get_similar_pinyin
-        
-        by_first_char = defaultdict(list)
-        by_last_char = defaultdict(list)
-        by_char = defaultdict(list)
-        by_pinyin_initials = defaultdict(list)
-        by_pinyin_no_tone = defaultdict(list)
-        by_rhyme = defaultdict(list)
-        by_length = defaultdict(list)
-        by_category = defaultdict(list)
-        by_structure = defaultdict(list)
-        by_char_pinyin = defaultdict(set)
-        by_similar_pinyin = defaultdict(set)
+        by_word: defaultdict[str, array] = defaultdict(_new_postings)
+        by_first_char: defaultdict[str, array] = defaultdict(_new_postings)
+        by_last_char: defaultdict[str, array] = defaultdict(_new_postings)
+        by_char: defaultdict[str, array] = defaultdict(_new_postings)
+        by_pinyin_initials: defaultdict[str, array] = defaultdict(_new_postings)
+        by_pinyin_no_tone: defaultdict[str, array] = defaultdict(_new_postings)
+        by_rhyme: defaultdict[str, array] = defaultdict(_new_postings)
+        by_length: defaultdict[int, array] = defaultdict(_new_postings)
+        by_category: defaultdict[str, array] = defaultdict(_new_postings)
+        by_structure: defaultdict[str, array] = defaultdict(_new_postings)
+        by_tones: defaultdict[str, array] = defaultdict(_new_postings)
+        words = self.words
         
-        for idx, word in enumerate(self.words):
-            by_first_char[word.first_char].append(idx)
-            self.char_freq_start[word.first_char] += 1
+        for idx, word in enumerate(words):
+            by_word[word.word].append(idx)
             
+            by_first_char[word.first_char].append(idx)
             by_last_char[word.last_char].append(idx)
-            self.char_freq_end[word.last_char] += 1
             
-            syllables = word.pinyin_no_tone.split() if word.pinyin_no_tone else []
-            for i, char in enumerate(word.chars):
+            for char in word.chars:
                 by_char[char].append(idx)
-                self.char_freq_all[char] += 1
-                
-                if i < len(syllables) and self._is_chinese_char(char):
-                    py_syllable = syllables[i]
-                    by_char_pinyin[py_syllable].add(char)
-                    
-                    similar_pys = get_similar_pinyin(py_syllable)
-                    for similar_py in similar_pys:
-                        by_similar_pinyin[py_syllable].add(similar_py)
             
             by_pinyin_initials[word.pinyin_initials].append(idx)
             by_pinyin_no_tone[word.pinyin_no_tone].append(idx)
             by_rhyme[word.rhyme].append(idx)
             by_length[word.length].append(idx)
             by_category[word.category].append(idx)
+            by_tones[word.tones].append(idx)
             
-            if word.structure:
-                by_structure[word.structure].append(idx)
+            structure = word.structure
+            if structure:
+                by_structure[structure].append(idx)
+        
+        # Counter.update counts an iterable in C, far cheaper than += per char
+        self.char_freq_start.update(word.first_char for word in words)
+        self.char_freq_end.update(word.last_char for word in words)
+        self.char_freq_all.update(chain.from_iterable(word.chars for word in words))
         
+        # Postings are appended in index order, so each array is already sorted
+        self.by_word = dict(by_word)
         self.by_first_char = dict(by_first_char)
         self.by_last_char = dict(by_last_char)
         self.by_char = dict(by_char)
@@ -98,5 +214,56 @@ class LexiconIndex:
         self.by_length = dict(by_length)
         self.by_category = dict(by_category)
         self.by_structure = dict(by_structure)
-        self.by_char_pinyin = dict(by_char_pinyin)
-        self.by_similar_pinyin = dict(by_similar_pinyin)
+        self.by_tones = dict(by_tones)
+    
+    @cached_property
+    def bitmaps(self) -> dict[str, dict]:
+        """Bitmap form of each index in BITMAP_INDEXES, keyed by index name."""
+        return {
+            name: {key: postings_to_bitmap(indices) for key, indices in getattr(self, name).items()}
+            for name in self.BITMAP_INDEXES
+        }
+    
+    @cached_property
+    def by_char_pinyin(self) -> dict[str, set[str]]:
+        """Hanzi grouped by toneless pinyin syllable, built on first use.
+        
+        Only pinyin-expanded searches need it, so plain lookups skip the
+        per-character pass.
+        """
+        by_char_pinyin: defaultdict[str, set[str]] = defaultdict(set)
+        hanzi_bitmap = _HANZI_BITMAP
+        
+        for pinyin_no_tone, chars in zip(
+            word_column(self.words, 'pinyin_no_tone'), word_column(self.words, 'chars')
+        ):
+            syllables = pinyin_no_tone.split() if pinyin_no_tone else []
+            syllable_count = len(syllables)
+            for i, char in enumerate(chars):
+                code_point = ord(char)
+                if i < syllable_count and hanzi_bitmap[code_point >> 3] & (1 << (code_point & 7)):
+                    by_char_pinyin[syllables[i]].add(char)
+        
+        return dict(by_char_pinyin)
+    
+    @cached_property
+    def by_similar_pinyin(self) -> dict[str, set[str]]:
+        """Similar-sounding syllables for every syllable in by_char_pinyin."""
+        from lexicon.pinyin_utils import get_similar_pinyin
+        
+        by_similar_pinyin: dict[str, set[str]] = {}
+        for syllable in self.by_char_pinyin:
+            similar_pys = get_similar_pinyin(syllable)
+            if similar_pys:
+                by_similar_pinyin[syllable] = set(similar_pys)
+        return by_similar_pinyin
+    
+    @cached_property
+    def word_blob(self) -> tuple[str, array] | None:
+        """Every word's text in one string, for whole-lexicon regex scans."""
+        return join_texts(list(word_column(self.words, 'word')))
+    
+    @cached_property
+    def pinyin_no_tone_blob(self) -> tuple[str, array] | None:
+        """Every word's toneless pinyin in one string, for regex scans."""
+        return join_texts(list(word_column(self.words, 'pinyin_no_tone')))
@@ -1,9 +1,14 @@
 """Data models for the Lexicon Lab application."""
 
-from dataclasses import dataclass
+from array import array
+from collections.abc import Iterator, Sequence
+from dataclasses import dataclass, fields
+from itertools import accumulate
+from operator import attrgetter
+from sys import intern
 
 
-@dataclass
+@dataclass(slots=True)
 class Word:
     """Chinese word model with linguistic properties."""
     
@@ -25,3 +30,177 @@ class Word:
     synonyms: list[str] | None      # 近义词
     antonyms: list[str] | None      # 反义词
     frequency: int | None           # 词频
+
+
+_WORD_FIELDS = tuple(field.name for field in fields(Word))
+
+
+class _TextColumn(Sequence[str | None]):
+    """Strings stored back to back in one blob, sliced out on access.
+    
+    None entries are flagged in a parallel byte string, so columns of
+    optional text round-trip exactly.
+    """
+    
+    __slots__ = ("blob", "starts", "nulls")
+    
+    def __init__(self, values: list[str | None]):
+        self.blob = "".join(value for value in values if value is not None)
+        self.starts = array("i" if len(self.blob) < 2**31 else "q", [0])
+        self.starts.extend(accumulate(len(value) if value is not None else 0 for value in values))
+        has_null = any(value is None for value in values)
+        self.nulls = bytes(value is None for value in values) if has_null else None
+    
+    def __len__(self) -> int:
+        return len(self.starts) - 1
+    
+    def __iter__(self) -> Iterator[str | None]:
+        for idx in range(len(self.starts) - 1):
+            yield self[idx]
+    
+    def __getitem__(self, idx):
+        if isinstance(idx, slice):
+            return [self[i] for i in range(*idx.indices(len(self)))]
+        if idx < 0:
+            idx += len(self.starts) - 1
+        if self.nulls is not None and self.nulls[idx]:
+            return None
+        starts = self.starts
+        return self.blob[starts[idx]:starts[idx + 1]]
+
+
+class _DictColumn(Sequence):
+    """Low-cardinality values stored once, with a small integer code per entry.
+    
+    Every entry with the same value returns the same object, so repeated
+    values are neither stored nor allocated more than once.
+    """
+    
+    __slots__ = ("values", "codes")
+    
+    def __init__(self, values: list):
+        distinct: dict = {}
+        codes = [distinct.setdefault(value, len(distinct)) for value in values]
+        self.values = list(distinct)
+        typecode = "B" if len(distinct) <= 0xFF else "H" if len(distinct) <= 0xFFFF else "i"
+        self.codes = array(typecode, codes)
+    
+    def __len__(self) -> int:
+        return len(self.codes)
+    
+    def __iter__(self) -> Iterator:
+        return map(self.values.__getitem__, self.codes)
+    
+    def __getitem__(self, idx):
+        if isinstance(idx, slice):
+            return list(map(self.values.__getitem__, self.codes[idx]))
+        return self.values[self.codes[idx]]
+
+
+class _CharsColumn(Sequence[list[str]]):
+    """Per-character lists derived from the word column instead of stored."""
+    
+    __slots__ = ("words",)
+    
+    def __init__(self, words: Sequence[str]):
+        self.words = words
+    
+    def __len__(self) -> int:
+        return len(self.words)
+    
+    def __iter__(self) -> Iterator[list[str]]:
+        for text in self.words:
+            yield list(map(intern, text))
+    
+    def __getitem__(self, idx):
+        if isinstance(idx, slice):
+            return [list(map(intern, text)) for text in self.words[idx]]
+        return list(map(intern, self.words[idx]))
+
+
+def _pack_column(values: list) -> Sequence:
+    """Pick the most compact column representation that round-trips values."""
+    if all(value is None or type(value) is str for value in values):
+        if len(set(values)) <= len(values) // 4:
+            return _DictColumn(values)
+        return _TextColumn(values)
+    if all(type(value) is int and -2**63 <= value < 2**63 for value in values):
+        return array("q", values)
+    return values
+
+
+class WordTable(Sequence[Word]):
+    """Column-oriented store of Words, building each Word on access.
+    
+    Every field is kept as one column (text fields as a single blob plus
+    offsets), so unpickling a table allocates a few dozen objects instead of
+    a Word and its strings per entry. Code that reads one field across many
+    words should go through word_column() rather than indexing Words.
+    """
+    
+    def __init__(self, words: Sequence[Word]):
+        self._length = len(words)
+        self._built: list[Word | None] = [None] * self._length
+        self._columns: dict[str, Sequence] = {}
+        for name in _WORD_FIELDS:
+            if name == "chars" and all(word.chars == list(word.word) for word in words):
+                self._columns[name] = _CharsColumn(self._columns["word"])
+            else:
+                self._columns[name] = _pack_column([getattr(word, name) for word in words])
+    
+    def __len__(self) -> int:
+        return self._length
+    
+    def __getitem__(self, idx):
+        if isinstance(idx, slice):
+            return [self[i] for i in range(*idx.indices(self._length))]
+        if idx < 0:
+            idx += self._length
+        if not 0 <= idx < self._length:
+            raise IndexError("WordTable index out of range")
+        # Built Words are kept, so repeated lookups return the same object
+        word = self._built[idx]
+        if word is None:
+            word = self._built[idx] = Word(*[column[idx] for column in self._columns.values()])
+        return word
+    
+    def __getstate__(self) -> dict:
+        state = self.__dict__.copy()
+        del state['_built']
+        return state
+    
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self._built = [None] * self._length
+    
+    def column(self, name: str) -> Sequence:
+        """Values of one Word field, indexed like the table."""
+        return self._columns[name]
+
+
+class _FieldView(Sequence):
+    """One field of a plain list of Words, read through getattr."""
+    
+    __slots__ = ("words", "name")
+    
+    def __init__(self, words: Sequence[Word], name: str):
+        self.words = words
+        self.name = name
+    
+    def __len__(self) -> int:
+        return len(self.words)
+    
+    def __iter__(self) -> Iterator:
+        return map(attrgetter(self.name), self.words)
+    
+    def __getitem__(self, idx):
+        if isinstance(idx, slice):
+            return [getattr(word, self.name) for word in self.words[idx]]
+        return getattr(self.words[idx], self.name)
+
+
+def word_column(words: Sequence[Word], name: str) -> Sequence:
+    """One Word field across words, read without building Word objects."""
+    if isinstance(words, WordTable):
+        return words.column(name)
+    return _FieldView(words, name)
@@ -14,8 +14,9 @@ Examples:
     "1,2"
 """
 
-from itertools import product
-from typing import List
+import re
+from functools import lru_cache
+from typing import List, Tuple
 
 from pypinyin import pinyin, lazy_pinyin, Style
 
@@ -60,6 +61,27 @@ def get_pinyin_no_tone(word: str) -> str:
     return " ".join(result)
 
 
+def _join_combinations(all_pinyins: List[List[str]], sep: str) -> List[str]:
+    """Join every per-character pronunciation combination, without duplicates.
+    
+    Equivalent to deduplicating the joined Cartesian product in order, but
+    pypinyin often repeats a reading for one character, so each position is
+    deduplicated first and strings are extended in place of building tuples.
+    
+    Args:
+        all_pinyins: Possible readings for each character, as returned by pypinyin
+        sep: Separator placed between syllables
+        
+    Returns:
+        List of joined combinations in product order
+    """
+    partial = [""]
+    for i, pys in enumerate(all_pinyins):
+        joiner = sep if i else ""
+        partial = [p + joiner + py for p in partial for py in dict.fromkeys(pys)]
+    return list(dict.fromkeys(partial))
+
+
 def get_pinyin_initials(word: str) -> List[str]:
     """Get ALL possible initial combinations for multi-pronunciation characters.
     
@@ -85,20 +107,27 @@ def get_pinyin_initials(word: str) -> List[str]:
     # Get all possible pronunciations for each character (heteronym=True)
     all_pinyins = pinyin(word, style=Style.FIRST_LETTER, heteronym=True)
     
-    # Generate Cartesian product of all initial combinations
     # each item in all_pinyins is a list of possible initials for that character
-    combinations = product(*all_pinyins)
-    
-    # Convert tuples to strings and remove duplicates while preserving order
-    result = []
-    seen = set()
-    for combo in combinations:
-        combo_str = "".join(combo)
-        if combo_str not in seen:
-            seen.add(combo_str)
-            result.append(combo_str)
-    
-    return result
+    return _join_combinations(all_pinyins, "")
+
+
+# Tone-marked vowel -> tone digit
+_TONE_MARKS = {
+    # a
+    'ā': '1', 'á': '2', 'ǎ': '3', 'à': '4',
+    # e
+    'ē': '1', 'é': '2', 'ě': '3', 'è': '4',
+    # i
+    'ī': '1', 'í': '2', 'ǐ': '3', 'ì': '4',
+    # o
+    'ō': '1', 'ó': '2', 'ǒ': '3', 'ò': '4',
+    # u
+    'ū': '1', 'ú': '2', 'ǔ': '3', 'ù': '4',
+    # ü
+    'ǖ': '1', 'ǘ': '2', 'ǚ': '3', 'ǜ': '4',
+}
+# Finds the first tone mark of a syllable in C instead of a per-char loop
+_TONE_MARK_RE = re.compile(f"[{''.join(_TONE_MARKS)}]")
 
 
 def get_tones(pinyin_str: str) -> str:
@@ -120,45 +149,10 @@ def get_tones(pinyin_str: str) -> str:
         >>> get_tones("bu yong xie")
         "0,4,4"  # 轻声 is tone 0
     """
-    # Tone mark to number mapping
-    tone_marks = {
-        'ā': '1', 'á': '1', 'ǎ': '3', 'à': '4',
-        'ē': '1', 'é': '2', 'ě': '3', 'è': '4',
-        'ī': '1', 'í': '2', 'ǐ': '3', 'ì': '4',
-        'ō': '1', 'ó': '2', 'ǒ': '3', 'ò': '4',
-        'ū': '1', 'ú': '2', 'ǔ': '3', 'ù': '4',
-        'ǖ': '1', 'ǘ': '2', 'ǚ': '3', 'ǜ': '4',
-        'ü': '0', 'v': '0',
-    }
-    
-    # More accurate tone mark mapping
-    tone_marks_accurate = {
-        # a
-        'ā': '1', 'á': '2', 'ǎ': '3', 'à': '4',
-        # e
-        'ē': '1', 'é': '2', 'ě': '3', 'è': '4',
-        # i
-        'ī': '1', 'í': '2', 'ǐ': '3', 'ì': '4',
-        # o
-        'ō': '1', 'ó': '2', 'ǒ': '3', 'ò': '4',
-        # u
-        'ū': '1', 'ú': '2', 'ǔ': '3', 'ù': '4',
-        # ü
-        'ǖ': '1', 'ǘ': '2', 'ǚ': '3', 'ǜ': '4',
-    }
-    
-    syllables = pinyin_str.split()
-    tones = []
-    
-    for syllable in syllables:
-        tone = '0'  # Default to neutral tone (轻声)
-        for char in syllable:
-            if char in tone_marks_accurate:
-                tone = tone_marks_accurate[char]
-                break
-        tones.append(tone)
-    
-    return ",".join(tones)
+    return ",".join([
+        _TONE_MARKS[match.group()] if (match := _TONE_MARK_RE.search(syllable)) else '0'  # 轻声
+        for syllable in pinyin_str.split()
+    ])
 
 
 def get_rhyme(word: str) -> str:
@@ -184,8 +178,17 @@ def get_rhyme(word: str) -> str:
         return ""
     
     # Get the final (韵母) of the last character
-    last_char = word[-1]
-    finals = pinyin(last_char, style=Style.FINALS, heteronym=False)
+    return _char_final(word[-1])
+
+
+@lru_cache(maxsize=None)
+def _char_final(char: str) -> str:
+    """Final of a single character.
+    
+    Memoized per character: the rhyme only depends on the last character, and
+    a few thousand distinct last characters cover every word in the lexicon.
+    """
+    finals = pinyin(char, style=Style.FINALS, heteronym=False)
     
     if finals and finals[0]:
         return finals[0][0]
@@ -214,19 +217,7 @@ def get_all_pinyin_variants(word: str) -> List[str]:
     # Get all possible pronunciations for each character
     all_pinyins = pinyin(word, style=Style.TONE, heteronym=True)
     
-    # Generate Cartesian product of all combinations
-    combinations = product(*all_pinyins)
-    
-    # Convert to space-separated strings
-    result = []
-    seen = set()
-    for combo in combinations:
-        combo_str = " ".join(combo)
-        if combo_str not in seen:
-            seen.add(combo_str)
-            result.append(combo_str)
-    
-    return result
+    return _join_combinations(all_pinyins, " ")
 
 
 def get_all_pinyin_no_tone_variants(word: str) -> List[str]:
@@ -245,19 +236,7 @@ def get_all_pinyin_no_tone_variants(word: str) -> List[str]:
     # Get all possible pronunciations for each character (no tone)
     all_pinyins = pinyin(word, style=Style.NORMAL, heteronym=True)
     
-    # Generate Cartesian product
-    combinations = product(*all_pinyins)
-    
-    # Convert to space-separated strings
-    result = []
-    seen = set()
-    for combo in combinations:
-        combo_str = " ".join(combo)
-        if combo_str not in seen:
-            seen.add(combo_str)
-            result.append(combo_str)
-    
-    return result
+    return _join_combinations(all_pinyins, " ")
 
 
 def pinyin_to_hanzi(pinyin_text: str) -> List[str]:
@@ -278,84 +257,113 @@ def pinyin_to_hanzi(pinyin_text: str) -> List[str]:
     return []
 
 
-def get_similar_pinyin(pinyin_text: str) -> List[str]:
+SIMILAR_INITIALS = {
+    'zh': ['z'],
+    'z': ['zh'],
+    'ch': ['c'],
+    'sh': ['s'],
+    'c': ['ch'],
+    's': ['sh'],
+    'n': ['l'],
+    'l': ['n'],
+    'f': ['h'],
+    'h': ['f'],
+}
+
+SIMILAR_FINALS = {
+    'an': ['ang', 'en'],
+    'ang': ['an', 'eng'],
+    'en': ['an', 'eng', 'in'],
+    'eng': ['ang', 'en', 'ing'],
+    'in': ['ing', 'en'],
+    'ing': ['in', 'eng'],
+    'ian': ['iang', 'uan', 'yan'],
+    'iang': ['ian', 'uang', 'yang'],
+    'uan': ['uang', 'ian', 'wan'],
+    'uang': ['uan', 'iang', 'wang'],
+    'ao': ['ou'],
+    'ou': ['ao'],
+    'ai': ['ei'],
+    'ei': ['ai'],
+    'ui': ['ei', 'ue'],
+    'ue': ['ui', 'ie'],
+    'ie': ['ue', 'ei'],
+    'uo': ['ou', 'o'],
+    'o': ['uo', 'ou'],
+}
+
+INITIALS = ['zh', 'ch', 'sh', 'b', 'p', 'm', 'f', 'd', 't', 'n', 'l', 
+            'g', 'k', 'h', 'j', 'q', 'x', 'r', 'z', 'c', 's', 'y', 'w']
+
+# Candidate initials keyed by first letter, longest first, so zh/ch/sh win
+# over z/c/s without sorting INITIALS on every call
+_INITIALS_BY_FIRST_LETTER = {
+    letter: [init for init in sorted(INITIALS, key=len, reverse=True) if init[0] == letter]
+    for letter in {init[0] for init in INITIALS}
+}
+
+
+def _expand_similar(initial: str, final: str) -> Tuple[str, ...]:
+    """Combine similar initials and finals for a split syllable."""
+    result = set()
+    
+    if initial in SIMILAR_INITIALS:
+        for sim_init in SIMILAR_INITIALS[initial]:
+            result.add(sim_init + final)
+    
+    if final in SIMILAR_FINALS:
+        for sim_final in SIMILAR_FINALS[final]:
+            result.add(initial + sim_final)
+            if initial in SIMILAR_INITIALS:
+                for sim_init in SIMILAR_INITIALS[initial]:
+                    result.add(sim_init + sim_final)
+    
+    result.discard(initial + final)
+    
+    return tuple(sorted(result))
+
+
+# Every (initial, final) pair with a similar final, expanded once at import;
+# other finals only vary by initial and are expanded on demand
+_SIMILAR_COMBOS = {
+    (initial, final): _expand_similar(initial, final)
+    for initial in ['', *INITIALS]
+    for final in SIMILAR_FINALS
+}
+
+
+@lru_cache(maxsize=4096)
+def get_similar_pinyin(pinyin_text: str) -> Tuple[str, ...]:
     """Get homophones (similar sounding pinyin).
     
+    Results are memoized, so the return value is an immutable tuple.
+    
     Args:
         pinyin_text: Pinyin string without tones (e.g., "wan", "zhang")
         
     Returns:
-        List of similar-sounding pinyin
+        Sorted tuple of similar-sounding pinyin
         
     Examples:
         >>> get_similar_pinyin("wan")
-        ['wang', 'wen', 'weng', 'yuan']
+        ('wang', 'wen')
         >>> get_similar_pinyin("zhang")
-        ['zang', 'zheng', 'chang', 'shang']
+        ('zan', 'zang', 'zeng', 'zhan', 'zheng')
     """
-    SIMILAR_INITIALS = {
-        'zh': ['z'],
-        'z': ['zh'],
-        'ch': ['c'],
-        'sh': ['s'],
-        'c': ['ch'],
-        's': ['sh'],
-        'n': ['l'],
-        'l': ['n'],
-        'f': ['h'],
-        'h': ['f'],
-    }
-    
-    SIMILAR_FINALS = {
-        'an': ['ang', 'en'],
-        'ang': ['an', 'eng'],
-        'en': ['an', 'eng', 'in'],
-        'eng': ['ang', 'en', 'ing'],
-        'in': ['ing', 'en'],
-        'ing': ['in', 'eng'],
-        'ian': ['iang', 'uan', 'yan'],
-        'iang': ['ian', 'uang', 'yang'],
-        'uan': ['uang', 'ian', 'wan'],
-        'uang': ['uan', 'iang', 'wang'],
-        'ao': ['ou'],
-        'ou': ['ao'],
-        'ai': ['ei'],
-        'ei': ['ai'],
-        'ui': ['ei', 'ue'],
-        'ue': ['ui', 'ie'],
-        'ie': ['ue', 'ei'],
-        'uo': ['ou', 'o'],
-        'o': ['uo', 'ou'],
-    }
-    
-    INITIALS = ['zh', 'ch', 'sh', 'b', 'p', 'm', 'f', 'd', 't', 'n', 'l', 
-                'g', 'k', 'h', 'j', 'q', 'x', 'r', 'z', 'c', 's', 'y', 'w']
-    
     pinyin_lower = pinyin_text.lower().strip()
-    result = set()
     
     initial = ''
     final = pinyin_lower
-    for init in sorted(INITIALS, key=len, reverse=True):
+    for init in _INITIALS_BY_FIRST_LETTER.get(pinyin_lower[:1], ()):
         if pinyin_lower.startswith(init):
             initial = init
             final = pinyin_lower[len(init):]
             break
     
-    if initial in SIMILAR_INITIALS:
-        for sim_init in SIMILAR_INITIALS[initial]:
-            result.add(sim_init + final)
-    
-    if final in SIMILAR_FINALS:
-        for sim_final in SIMILAR_FINALS[final]:
-            result.add(initial + sim_final)
-            if initial in SIMILAR_INITIALS:
-                for sim_init in SIMILAR_INITIALS[initial]:
-                    result.add(sim_init + sim_final)
-    
-    result.discard(pinyin_lower)
-    
-    return sorted(list(result))
+    combos = _SIMILAR_COMBOS.get((initial, final))
+    if combos is None:
+        combos = _expand_similar(initial, final)
+    return combos
 
 
 def expand_pinyin_wildcards(pinyin_pattern: str) -> List[str]:
@@ -2,11 +2,12 @@
 
 import pytest
 from typer.testing import CliRunner
-from lexicon.cli import app
+from lexicon.cli import app, _format_word_line, _is_chinese_character, _scan_batch_patterns
 from lexicon.models import Word
 from lexicon.search import SearchEngine
 from lexicon.index import LexiconIndex
 from unittest.mock import Mock, patch
+import json
 import random
 
 
@@ -187,6 +188,62 @@ def sample_words_for_fill():
     ]
 
 
+@pytest.fixture
+def chain_words():
+    """Create idioms that can be chained: 一心一意 → 意气风发."""
+    return [
+        Word(
+            word="一心一意",
+            pinyin="yī xīn yī yì",
+            pinyin_no_tone="yi xin yi yi",
+            pinyin_initials="yxyy",
+            tones="1,1,1,4",
+            rhyme="i",
+            first_char="一",
+            last_char="意",
+            chars=["一", "心", "一", "意"],
+            length=4,
+            definition="专心致志",
+            source=None,
+            example=None,
+            category="成语",
+            structure="ABAC",
+            synonyms=None,
+            antonyms=None,
+            frequency=None,
+        ),
+        Word(
+            word="意气风发",
+            pinyin="yì qì fēng fā",
+            pinyin_no_tone="yi qi feng fa",
+            pinyin_initials="yqff",
+            tones="4,4,1,1",
+            rhyme="a",
+            first_char="意",
+            last_char="发",
+            chars=["意", "气", "风", "发"],
+            length=4,
+            definition="精神振奋",
+            source=None,
+            example=None,
+            category="成语",
+            structure=None,
+            synonyms=None,
+            antonyms=None,
+            frequency=None,
+        ),
+    ]
+
+
+@pytest.fixture
+def chain_search_engine(chain_words):
+    """Create mock SearchEngine for chain tests."""
+    engine = SearchEngine.__new__(SearchEngine)
+    engine.words = chain_words
+    engine.index = LexiconIndex(chain_words)
+    return engine
+
+
 @pytest.fixture
 def mock_search_engine(sample_words):
     """Create mock SearchEngine."""
@@ -284,6 +341,67 @@ class TestSearchCommand:
         assert result.exit_code == 0
         assert "中国" in result.stdout
 
+    @patch("lexicon.cli.get_search_engine")
+    def test_search_export_csv(self, mock_get_engine, mock_search_engine, tmp_path):
+        """Test search results exported to a CSV file."""
+        mock_get_engine.return_value = mock_search_engine
+        output_file = tmp_path / "results.csv"
+        result = runner.invoke(app, ["search", "--regex", "^中", "--format", "csv", "--output", str(output_file)])
+        assert result.exit_code == 0
+        lines = output_file.read_text(encoding="utf-8").splitlines()
+        assert lines[0] == "word,pinyin,definition,category,length"
+        assert lines[1] == "中国,zhōng guó,东亚国家,词语,2"
+
+    @patch("lexicon.cli.get_search_engine")
+    def test_search_export_json_stdout(self, mock_get_engine, mock_search_engine):
+        """Test search results exported as JSON to stdout."""
+        mock_get_engine.return_value = mock_search_engine
+        result = runner.invoke(app, ["search", "--regex", "^中", "--format", "json"])
+        assert result.exit_code == 0
+        data = json.loads(result.stdout)
+        assert data[0]["word"] == "中国"
+
+    @patch("lexicon.cli.get_search_engine")
+    def test_search_export_json_file(self, mock_get_engine, mock_search_engine, tmp_path):
+        """Test search results exported to a JSON file."""
+        mock_get_engine.return_value = mock_search_engine
+        output_file = tmp_path / "results.json"
+        result = runner.invoke(app, ["search", "--regex", "^中", "--format", "json", "--output", str(output_file)])
+        assert result.exit_code == 0
+        data = json.loads(output_file.read_text(encoding="utf-8"))
+        assert [w["word"] for w in data] == ["中国"]
+
+    @patch("lexicon.cli.get_search_engine")
+    def test_search_export_text_file(self, mock_get_engine, mock_search_engine, tmp_path):
+        """Test search results exported to a text file."""
+        mock_get_engine.return_value = mock_search_engine
+        output_file = tmp_path / "results.txt"
+        result = runner.invoke(app, ["search", "--regex", "^中", "--no-definition", "--output", str(output_file)])
+        assert result.exit_code == 0
+        assert output_file.read_text(encoding="utf-8") == "找到 1 条结果:\n\n1. 中国 [zhōng guó]"
+
+    @patch("lexicon.cli.LARGE_OUTPUT_THRESHOLD", 0)
+    @patch("lexicon.cli.get_search_engine")
+    def test_search_large_text_output(self, mock_get_engine, mock_search_engine):
+        """Test large text output written as bytes matches the echo path."""
+        mock_get_engine.return_value = mock_search_engine
+        result = runner.invoke(app, ["search", "--regex", "^中"])
+        assert result.exit_code == 0
+        assert result.stdout == "找到 1 条结果:\n\n1. 中国 [zhōng guó] - 东亚国家\n"
+
+    @patch("lexicon.cli.orjson", None)
+    @patch("lexicon.cli.get_search_engine")
+    def test_search_export_json_without_orjson(self, mock_get_engine, mock_search_engine, tmp_path):
+        """Test JSON export falls back to the json module with all Word fields."""
+        mock_get_engine.return_value = mock_search_engine
+        output_file = tmp_path / "results.json"
+        result = runner.invoke(app, ["search", "--regex", "^天", "--format", "json", "--output", str(output_file)])
+        assert result.exit_code == 0
+        data = json.loads(output_file.read_text(encoding="utf-8"))
+        assert data[0]["word"] == "天长地久"
+        assert data[0]["chars"] == ["天", "长", "地", "久"]
+        assert data[0]["source"] == "老子"
+
 
 class TestDefineCommand:
     """Test define command."""
@@ -334,6 +452,26 @@ class TestChainCommand:
         # Should have chain output or error message
         assert "🔗" in result.stdout or "无法找到" in result.stdout
 
+    @patch("lexicon.cli.get_search_engine")
+    def test_chain_no_idiom_for_start_char(self, mock_get_engine, mock_search_engine):
+        """Test chain when no idiom starts with the given char."""
+        mock_get_engine.return_value = mock_search_engine
+        result = runner.invoke(app, ["chain", "中"])
+        assert result.exit_code == 0
+        assert "无法找到" in result.stdout
+        assert "🔗" not in result.stdout
+
+    @patch("lexicon.cli.get_search_engine")
+    def test_chain_links_idioms(self, mock_get_engine, chain_search_engine):
+        """Test chain follows an idiom that has followers."""
+        mock_get_engine.return_value = chain_search_engine
+        result = runner.invoke(app, ["chain", "一", "--count", "2"])
+        assert result.exit_code == 0
+        assert "一 → 一心一意" in result.stdout
+        # 意气风发 has no follower, so it is never picked and the chain stops
+        assert "意气风发" not in result.stdout
+        assert "没有可选的成语" in result.stdout
+
     @patch("lexicon.cli.get_search_engine")
     def test_chain_invalid_char(self, mock_get_engine, mock_search_engine):
         """Test chain with invalid char length."""
@@ -405,6 +543,15 @@ class TestStatsCommand:
         assert result.exit_code == 0
         assert "📊" in result.stdout
 
+    @patch("lexicon.cli.get_search_engine")
+    def test_stats_category_counts(self, mock_get_engine, mock_search_engine):
+        """Test stats reports per-category counts."""
+        mock_get_engine.return_value = mock_search_engine
+        result = runner.invoke(app, ["stats"])
+        assert result.exit_code == 0
+        assert "成语: 1" in result.stdout
+        assert "词语: 2" in result.stdout
+
 
 class TestFreqCommand:
     """Test freq command."""
@@ -438,6 +585,14 @@ class TestFreqCommand:
         assert result.exit_code == 0
         assert "📊" in result.stdout
 
+    @patch("lexicon.cli.get_search_engine")
+    def test_freq_output_lines(self, mock_get_engine, mock_search_engine):
+        """Test freq prints one line per character followed by a blank line."""
+        mock_get_engine.return_value = mock_search_engine
+        result = runner.invoke(app, ["freq", "--position", "start", "--limit", "2"])
+        assert result.exit_code == 0
+        assert result.stdout == "\n📊 字频统计 (首字):\n   中: 1\n   天: 1\n\n"
+
     @patch("lexicon.cli.get_search_engine")
     def test_freq_invalid_position(self, mock_get_engine, mock_search_engine):
         """Test freq command with invalid position."""
@@ -491,6 +646,18 @@ class TestQuizCommand:
         assert result.exit_code == 0
         assert "🎯" in result.stdout
 
+    @patch("random.choice")
+    @patch("lexicon.cli.get_search_engine")
+    def test_quiz_repeated_char_hint(self, mock_get_engine, mock_choice, mock_search_engine):
+        """Test quiz second hint lists positions of repeated characters."""
+        quiz_runner = CliRunner()
+        mock_get_engine.return_value = mock_search_engine
+        mock_choice.side_effect = lambda x: x[0]
+        result = quiz_runner.invoke(app, ["quiz", "--category", "词语", "--length", "4"], input="错\n错\n错\n")
+        assert result.exit_code == 0
+        assert "「高」出现在第 1, 2 位; 「兴」出现在第 3, 4 位" in result.stdout
+        assert "高高兴兴" in result.stdout
+
     @patch("lexicon.cli.get_search_engine")
     def test_quiz_invalid_length(self, mock_get_engine, mock_search_engine):
         """Test quiz with invalid length."""
@@ -581,6 +748,22 @@ class TestFillCommand:
         result = runner.invoke(app, ["fill", "天?地?", "--category", "成语"])
         assert result.exit_code == 0 or "天" in result.stdout
 
+    @patch("lexicon.cli.get_search_engine")
+    def test_fill_fixed_length_respects_limit(self, mock_get_engine, mock_search_engine_for_fill):
+        """Test fill without * stops at the limit."""
+        mock_get_engine.return_value = mock_search_engine_for_fill
+        result = runner.invoke(app, ["fill", "天?地?", "--limit", "1"])
+        assert result.exit_code == 0
+        assert "✨ 找到答案：天长地久" in result.stdout
+
+    @patch("lexicon.cli.get_search_engine")
+    def test_fill_star_wildcard(self, mock_get_engine, mock_search_engine_for_fill):
+        """Test fill with * falls back to regex matching."""
+        mock_get_engine.return_value = mock_search_engine_for_fill
+        result = runner.invoke(app, ["fill", "?国*"])
+        assert result.exit_code == 0
+        assert "✨ 找到答案：中国" in result.stdout
+
     @patch("random.choice")
     @patch("lexicon.cli.get_search_engine")
     def test_fill_game_correct_guess(self, mock_get_engine, mock_choice, mock_search_engine_for_fill):
@@ -602,6 +785,132 @@ class TestFillCommand:
         assert "✅" in result.stdout
 
 
+class TestFlyCommand:
+    """Test fly command."""
+
+    @patch("lexicon.cli.get_search_engine")
+    def test_fly_start(self, mock_get_engine, mock_search_engine):
+        """Test fly with start position."""
+        mock_get_engine.return_value = mock_search_engine
+        result = runner.invoke(app, ["fly", "天", "--position", "start"])
+        assert result.exit_code == 0
+        assert "天长地久" in result.stdout
+
+    @patch("lexicon.cli.get_search_engine")
+    def test_fly_end(self, mock_get_engine, mock_search_engine):
+        """Test fly with end position."""
+        mock_get_engine.return_value = mock_search_engine
+        result = runner.invoke(app, ["fly", "国", "--position", "end"])
+        assert result.exit_code == 0
+        assert "中国" in result.stdout
+
+    @patch("lexicon.cli.get_search_engine")
+    def test_fly_any(self, mock_get_engine, mock_search_engine):
+        """Test fly with any position."""
+        mock_get_engine.return_value = mock_search_engine
+        result = runner.invoke(app, ["fly", "兴"])
+        assert result.exit_code == 0
+        assert "高高兴兴" in result.stdout
+
+    @patch("lexicon.cli.get_search_engine")
+    def test_fly_non_chinese(self, mock_get_engine, mock_search_engine):
+        """Test fly rejects non-Chinese input."""
+        mock_get_engine.return_value = mock_search_engine
+        result = runner.invoke(app, ["fly", "a"])
+        assert result.exit_code == 1
+
+
+class TestBatchCommand:
+    """Test batch command."""
+
+    @patch("lexicon.cli.get_search_engine")
+    def test_batch_literal_and_regex(self, mock_get_engine, mock_search_engine, tmp_path):
+        """Test literal lines, regex lines, comments and duplicates."""
+        mock_get_engine.return_value = mock_search_engine
+        input_file = tmp_path / "queries.txt"
+        input_file.write_text("# comment\n中国\n不存在\n天.地.\n中国\n", encoding="utf-8")
+        result = runner.invoke(app, ["batch", str(input_file)])
+        assert result.exit_code == 0
+        assert "中国" in result.stdout
+        assert "天长地久" in result.stdout
+        assert "处理了 4 行，找到 2 条结果" in result.stdout
+
+    @patch("lexicon.cli.get_search_engine")
+    def test_batch_literal_skips_regex_search(self, mock_get_engine, mock_search_engine, tmp_path):
+        """Test literal lines are answered from the word index without a regex scan."""
+        mock_get_engine.return_value = mock_search_engine
+        input_file = tmp_path / "queries.txt"
+        input_file.write_text("中国\n天长地久\n", encoding="utf-8")
+        with patch.object(mock_search_engine, "search") as mock_search:
+            result = runner.invoke(app, ["batch", str(input_file)])
+        assert result.exit_code == 0
+        mock_search.assert_not_called()
+        assert "处理了 2 行，找到 2 条结果" in result.stdout
+
+    @patch("lexicon.cli.get_search_engine")
+    def test_batch_invalid_regex_line(self, mock_get_engine, mock_search_engine, tmp_path):
+        """Test an invalid regex line is skipped without failing the batch."""
+        mock_get_engine.return_value = mock_search_engine
+        input_file = tmp_path / "queries.txt"
+        input_file.write_text("中(\n..\n", encoding="utf-8")
+        result = runner.invoke(app, ["batch", str(input_file)])
+        assert result.exit_code == 0
+        assert "中国" in result.stdout
+        assert "处理了 2 行，找到 1 条结果" in result.stdout
+
+    def test_scan_batch_patterns_limit(self, sample_words):
+        """Test each pattern stops collecting at the limit."""
+        import re
+
+        matches = _scan_batch_patterns(sample_words, [re.compile("^.+$"), re.compile("^中国$")], 2)
+        assert [w.word for w in matches[0]] == [w.word for w in sample_words[:2]]
+        assert [w.word for w in matches[1]] == ["中国"]
+
+    @patch("lexicon.cli.get_search_engine")
+    def test_batch_empty_file(self, mock_get_engine, mock_search_engine, tmp_path):
+        """Test batch rejects a file with no queries."""
+        mock_get_engine.return_value = mock_search_engine
+        input_file = tmp_path / "queries.txt"
+        input_file.write_text("# only a comment\n\n", encoding="utf-8")
+        result = runner.invoke(app, ["batch", str(input_file)])
+        assert result.exit_code == 1
+
+
+class TestFormatWordLine:
+    """Test the shared result line formatter."""
+
+    def test_full_line(self, sample_words):
+        """Test line with pinyin and definition."""
+        assert _format_word_line(1, sample_words[0]) == "1. 中国 [zhōng guó] - 东亚国家"
+
+    def test_hidden_fields(self, sample_words):
+        """Test line with pinyin and definition hidden."""
+        assert _format_word_line(2, sample_words[0], show_pinyin=False) == "2. 中国 - 东亚国家"
+        assert _format_word_line(3, sample_words[0], show_definition=False) == "3. 中国 [zhōng guó]"
+
+
+class TestIsChineseCharacter:
+    """Test CJK character detection used by fly."""
+
+    def test_common_characters(self):
+        """Test characters in the basic CJK block."""
+        assert _is_chinese_character("中")
+        assert _is_chinese_character("一")
+        assert _is_chinese_character("\u9fff")
+
+    def test_extension_characters(self):
+        """Test characters in CJK extension blocks."""
+        assert _is_chinese_character("\u3400")
+        assert _is_chinese_character("\U00020000")
+        assert _is_chinese_character("\U0002EBEF")
+
+    def test_non_chinese_characters(self):
+        """Test characters outside every CJK range."""
+        assert not _is_chinese_character("a")
+        assert not _is_chinese_character("\u4dc0")
+        assert not _is_chinese_character("\U0002EBF0")
+
+
 class TestCliIntegration:
     """Integration tests for CLI."""
 
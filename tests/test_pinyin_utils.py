@@ -10,6 +10,7 @@ from lexicon.pinyin_utils import (
     get_all_pinyin_variants,
     get_all_pinyin_no_tone_variants,
     expand_pinyin_wildcards,
+    get_similar_pinyin,
 )
 
 
@@ -244,6 +245,36 @@ class TestGetAllPinyinNoToneVariants:
         assert result == [''] or result == []
 
 
+class TestGetSimilarPinyin:
+    """Test get_similar_pinyin function."""
+
+    def test_front_back_nasal(self):
+        """Test an/ang style confusions are returned."""
+        result = get_similar_pinyin("zhan")
+        assert "zhang" in result
+        assert "zan" in result
+
+    def test_excludes_input(self):
+        """Test the input syllable itself is not included."""
+        assert "zhan" not in get_similar_pinyin("zhan")
+
+    def test_returns_cached_tuple(self):
+        """Test results are memoized as immutable tuples."""
+        result = get_similar_pinyin("zhan")
+        assert isinstance(result, tuple)
+        assert get_similar_pinyin("zhan") is result
+
+    def test_docstring_examples(self):
+        """Test the documented examples match the real output."""
+        import doctest
+
+        runner = doctest.DocTestRunner()
+        for test in doctest.DocTestFinder().find(get_similar_pinyin):
+            runner.run(test)
+        results = runner.summarize(verbose=False)
+        assert results.attempted and not results.failed
+
+
 class TestExpandPinyinWildcards:
     """Test expand_pinyin_wildcards function - @ wildcard for finals."""
 
@@ -1,10 +1,14 @@
 """Tests for search engine functionality."""
 
+import re
+from concurrent.futures.process import BrokenProcessPool
+
 import pytest
-from lexicon.models import Word
-from lexicon.search import SearchEngine
-from lexicon.index import LexiconIndex
+from lexicon.models import Word, WordTable, word_column
+from lexicon.search import SearchEngine, _build_words, _expand_with_homophone
+from lexicon.index import LexiconIndex, bitmap_to_indices, join_texts, postings_to_bitmap
 from pathlib import Path
+from unittest.mock import patch
 
 
 @pytest.fixture
@@ -212,6 +216,11 @@ class TestSearchByPinyin:
         results = mock_search_engine.search(pinyin="xy")
         assert len(results) == 0
 
+    def test_homophone_initials(self):
+        """Test similar initials are swapped in at every position."""
+        assert _expand_with_homophone("nh") == {"nh", "lh", "nf", "lf"}
+        assert _expand_with_homophone("zg") == {"zg"}
+
 
 class TestSearchByRhyme:
     """Test search by rhyme/final."""
@@ -254,6 +263,37 @@ class TestSearchByRegex:
         results = mock_search_engine.search(regex="[invalid")
         assert len(results) == 0
 
+    @pytest.mark.parametrize("pattern", ["国$", "^天", "[^一]一", "\\s", "(.)\\1", "^", "长(?=地)", "\\A一"])
+    def test_search_regex_matches_each_word_alone(self, mock_search_engine, pattern):
+        """Test the joined-text scan finds exactly the words matching on their own."""
+        expected = [w.word for w in mock_search_engine.words if re.search(pattern, w.word)]
+        results = mock_search_engine.search(regex=pattern, limit=0)
+        assert [w.word for w in results] == expected
+
+    @pytest.mark.parametrize("pattern, blob", [
+        ("^中.*国$", True),
+        ("(.)\\1", True),
+        ("[^子]+子$", False),
+        ("^\\D*\ue000", False),
+        ("\\W+", False),
+        ("[\\s\\S]", False),
+        ("[\\t-\\r]", False),
+        ("\\x0a", False),
+        ("中\n国", False),
+    ])
+    def test_search_regex_blob_only_when_newline_unmatchable(self, mock_search_engine, pattern, blob):
+        """Test patterns that may match the word separator are matched word by word."""
+        with patch.object(mock_search_engine, "_scan_blob", wraps=mock_search_engine._scan_blob) as scan_blob:
+            mock_search_engine.search(regex=pattern, limit=0)
+        assert scan_blob.called == blob
+
+    def test_join_texts_rejects_newlines(self):
+        """Test texts containing the separator are not joined."""
+        assert join_texts(["中国", "天\n地"]) is None
+        blob, starts = join_texts(["中国", "天"])
+        assert blob == "中国\n天"
+        assert list(starts) == [0, 3, 5]
+
 
 class TestSearchCombined:
     """Test combined search criteria."""
@@ -281,6 +321,15 @@ class TestSearchCombined:
         results = mock_search_engine.search(regex="^中.*意$")
         assert len(results) == 0
 
+    @pytest.mark.parametrize("cost", [0, 1000])
+    def test_predicate_and_intersection_paths_agree(self, mock_search_engine, cost):
+        """Test filters give the same result checked per candidate or intersected."""
+        with patch("lexicon.search.PREDICATE_COST", cost):
+            results = mock_search_engine.search(exact="一心一意", category="成语", length=4, pinyin="yxyy")
+            assert [w.word for w in results] == ["一心一意"]
+            assert mock_search_engine.search(exact="一心一意", category="词语") == []
+            assert mock_search_engine.search(contains="天", length=4, rhyme="ong") == []
+
 
 class TestSearchLimit:
     """Test search limit parameter."""
@@ -300,6 +349,13 @@ class TestSearchLimit:
         results = mock_search_engine.search(limit=100)
         assert len(results) <= len(mock_search_engine.words)
 
+    @pytest.mark.parametrize("filters", [{}, {"length": 4}, {"category": "成语", "length": 4}])
+    def test_search_pages(self, mock_search_engine, filters):
+        """Test consecutive pages cover the full result list in order."""
+        everything = mock_search_engine.search(limit=0, **filters)
+        pages = [mock_search_engine.search(limit=2, page=page, **filters) for page in (1, 2, 3)]
+        assert [w for page in pages for w in page] == everything
+
 
 class TestSearchEdgeCases:
     """Test edge cases for search."""
@@ -331,6 +387,36 @@ class TestSearchPinyinExpansion:
         assert len(results) >= 1
         assert any(w.word == "一心一意" for w in results)
 
+    def test_pinyin_regex_compiled_once(self, mock_search_engine):
+        """Test repeated pinyin regex searches reuse the compiled patterns."""
+        with patch.object(
+            mock_search_engine, "_convert_to_pinyin_pattern", wraps=mock_search_engine._convert_to_pinyin_pattern
+        ) as convert:
+            first = mock_search_engine.search(regex="^yi.*yi.*$", enable_pinyin=True)
+            second = mock_search_engine.search(regex="^yi.*yi.*$", enable_pinyin=True)
+        assert first == second
+        assert convert.call_count == 1
+
+    def test_pinyin_pattern_escaped_backslash_before_class(self, mock_search_engine):
+        """Test brackets after an escaped backslash still open and close classes."""
+        convert = mock_search_engine._convert_to_pinyin_pattern
+        assert convert(r"^[\\]$") == r"^[\\]$"
+        assert convert(r"[\\]zhong") == r"[\\]zhong"
+        assert convert(r"zhong[\]]guo") == r"zhong [\]]guo"
+
+    def test_pinyin_expansion_memoized(self, mock_search_engine):
+        """Test syllable expansions are cached and cannot be mutated."""
+        expanded = mock_search_engine._expand_with_pinyin("yi")
+        assert isinstance(expanded, frozenset)
+        assert "yi" in expanded and "一" in expanded
+        assert mock_search_engine._expand_with_pinyin("yi") is expanded
+
+    @pytest.mark.parametrize("filters", [{"category": "成语"}, {"length": 4}])
+    def test_regex_pinyin_with_one_dense_filter(self, mock_search_engine, filters):
+        """Test the pinyin scan still sees the candidates of a lone bitmap filter."""
+        results = mock_search_engine.search(regex="^yi", enable_pinyin=True, limit=0, **filters)
+        assert [w.word for w in results] == ["一心一意"]
+
     def test_regex_pinyin_complex_pattern(self, mock_search_engine):
         """Test regex with complex pattern and pinyin expansion."""
         results = mock_search_engine.search(regex="yan.*yan", enable_pinyin=True)
@@ -342,3 +428,365 @@ class TestSearchPinyinExpansion:
         results = mock_search_engine.search(regex="^yixin", enable_pinyin=True)
         assert len(results) >= 1
         assert any(w.word == "一心一意" for w in results)
+
+
+class TestIsChineseChar:
+    """Test the index's hanzi bitmap lookup."""
+
+    @pytest.mark.parametrize("char", ["中", "㐀", "\U00020000", "\uf900", "\U0002f800"])
+    def test_hanzi(self, char):
+        """Test characters inside the CJK ranges."""
+        assert LexiconIndex._is_chinese_char(char)
+
+    @pytest.mark.parametrize("char", ["a", "1", "，", "\u9fff\u4e00", "", "\U0010ffff"])
+    def test_non_hanzi(self, char):
+        """Test characters and strings outside the CJK ranges."""
+        assert not LexiconIndex._is_chinese_char(char)
+
+
+class TestLazyPinyinIndexes:
+    """Test the on-demand pinyin indexes of LexiconIndex."""
+
+    def test_built_on_first_access(self, test_index):
+        """Test the pinyin indexes are not built with the main index."""
+        assert "by_char_pinyin" not in vars(test_index)
+        assert "by_similar_pinyin" not in vars(test_index)
+        assert test_index.by_char_pinyin["tian"] == {"天"}
+        assert "zong" in test_index.by_similar_pinyin["zhong"]
+
+
+class TestBitmaps:
+    """Test the bitmap form of the dense indexes."""
+
+    def test_round_trip(self):
+        """Test packing and unpacking posting lists."""
+        assert bitmap_to_indices(postings_to_bitmap([0, 3, 9, 64])) == [0, 3, 9, 64]
+        assert bitmap_to_indices(postings_to_bitmap([])) == []
+
+    def test_matches_postings(self, test_index):
+        """Test each bitmap covers the same words as its posting list."""
+        for name in LexiconIndex.BITMAP_INDEXES:
+            for key, indices in getattr(test_index, name).items():
+                assert bitmap_to_indices(test_index.bitmaps[name][key]) == list(indices)
+
+
+class TestIndexPickling:
+    """Test the packed on-disk form of the posting indexes."""
+
+    def test_round_trip(self, test_index):
+        """Test posting dicts survive pickling and unpack on first access."""
+        import pickle
+
+        loaded = pickle.loads(pickle.dumps(test_index))
+        assert "by_word" not in vars(loaded)
+        for name in LexiconIndex.POSTING_INDEXES:
+            assert getattr(loaded, name) == getattr(test_index, name)
+        assert "by_word" in vars(loaded)
+
+    def test_repickle_keeps_packed(self, test_index):
+        """Test indexes still packed are carried over when pickled again."""
+        import pickle
+
+        loaded = pickle.loads(pickle.dumps(test_index))
+        loaded.by_char
+        reloaded = pickle.loads(pickle.dumps(loaded))
+        assert reloaded.by_word == test_index.by_word
+        assert reloaded.by_char == test_index.by_char
+
+    def test_missing_attribute(self, test_index):
+        """Test unknown attributes still raise AttributeError."""
+        with pytest.raises(AttributeError):
+            test_index.no_such_index
+
+
+class TestWordTable:
+    """Test the columnar word store used by the cache."""
+
+    def test_round_trip(self, sample_words):
+        """Test a pickled table rebuilds equal Words."""
+        import pickle
+
+        table = pickle.loads(pickle.dumps(WordTable(sample_words)))
+        assert len(table) == len(sample_words)
+        assert list(table) == sample_words
+        assert table[-1] == sample_words[-1]
+        assert table[1:3] == sample_words[1:3]
+        assert table[0] is table[0]
+
+    def test_optional_fields(self, sample_words):
+        """Test None and empty text are kept apart."""
+        sample_words[0].source = ""
+        table = WordTable(sample_words)
+        assert table[0].source == ""
+        assert table[2].source is None
+
+    def test_repeated_values_shared(self, sample_words):
+        """Test low-cardinality fields return one shared object per value."""
+        words = sample_words * 4
+        table = WordTable(words)
+        assert [w.category for w in table] == [w.category for w in words]
+        assert table[0].category is table[len(sample_words)].category
+
+    def test_word_column(self, sample_words):
+        """Test field columns read the same values from tables and lists."""
+        table = WordTable(sample_words)
+        for name in ("word", "length", "chars", "structure"):
+            expected = [getattr(w, name) for w in sample_words]
+            assert list(word_column(table, name)) == expected
+            assert list(word_column(sample_words, name)) == expected
+            assert list(word_column(table, name)[1:4]) == expected[1:4]
+            assert list(word_column(table, name)[::-2]) == expected[::-2]
+
+
+class TestIdiomsByFirstChar:
+    """Test the idiom first-character grouping used by chain."""
+
+    def test_groups_only_idioms(self, mock_search_engine):
+        """Test that only 成语 entries are grouped."""
+        groups = mock_search_engine.idioms_by_first_char
+        assert set(groups) == {"天", "一"}
+        assert [w.word for w in groups["天"]] == ["天长地久"]
+
+    def test_missing_char(self, mock_search_engine):
+        """Test lookup for a character no idiom starts with."""
+        assert mock_search_engine.idioms_by_first_char.get("中", []) == []
+
+
+class TestWordIndices:
+    """Test bucketed word index lookup used by random-word and quiz."""
+
+    def test_no_filters(self, mock_search_engine):
+        """Test that no filters returns every index."""
+        assert list(mock_search_engine.word_indices()) == [0, 1, 2, 3, 4]
+
+    def test_category_only(self, mock_search_engine):
+        """Test filtering by category."""
+        assert list(mock_search_engine.word_indices(category="成语")) == [1, 3]
+
+    def test_length_only(self, mock_search_engine):
+        """Test filtering by length."""
+        assert list(mock_search_engine.word_indices(length=2)) == [0]
+
+    def test_category_and_length(self, mock_search_engine):
+        """Test filtering by category and length together."""
+        assert list(mock_search_engine.word_indices(category="词语", length=4)) == [2, 4]
+        assert list(mock_search_engine.word_indices(category="成语", length=2)) == []
+
+
+class TestSearchLiteral:
+    """Test index-backed literal search parameters."""
+
+    def test_exact(self, mock_search_engine):
+        """Test exact word lookup."""
+        results = mock_search_engine.search(exact="中国")
+        assert [w.word for w in results] == ["中国"]
+
+    def test_exact_no_regex_semantics(self, mock_search_engine):
+        """Test exact lookup treats the text literally."""
+        assert mock_search_engine.search(exact="中.") == []
+
+    def test_prefix_single_char(self, mock_search_engine):
+        """Test prefix lookup with one character."""
+        results = mock_search_engine.search(prefix="研")
+        assert [w.word for w in results] == ["研究研究"]
+
+    def test_prefix_multi_char(self, mock_search_engine):
+        """Test prefix lookup with several characters."""
+        assert [w.word for w in mock_search_engine.search(prefix="一心")] == ["一心一意"]
+        assert mock_search_engine.search(prefix="一意") == []
+
+    def test_suffix(self, mock_search_engine):
+        """Test suffix lookup."""
+        results = mock_search_engine.search(suffix="地久")
+        assert [w.word for w in results] == ["天长地久"]
+
+    def test_contains(self, mock_search_engine):
+        """Test single character containment lookup."""
+        results = mock_search_engine.search(contains="心", category="成语")
+        assert [w.word for w in results] == ["一心一意"]
+
+
+@pytest.fixture
+def data_dir(tmp_path):
+    """Create a small raw data directory."""
+    import orjson
+
+    raw_dir = tmp_path / "raw"
+    raw_dir.mkdir()
+    (raw_dir / "idiom_merged.json").write_bytes(orjson.dumps([
+        {"word": "一心一意", "explanation": "专心致志", "derivation": "", "example": ""},
+        {"word": "意气风发", "explanation": "精神振奋", "derivation": "", "example": ""},
+    ]))
+    (raw_dir / "word.json").write_bytes(orjson.dumps([]))
+    (raw_dir / "xiehouyu.json").write_bytes(orjson.dumps([
+        {"riddle": "八仙过海", "answer": "各显神通"},
+    ]))
+    (raw_dir / "ci.json").write_bytes(orjson.dumps([
+        {"ci": "中国", "explanation": "东亚国家"},
+    ]))
+    return raw_dir
+
+
+@pytest.fixture
+def cache_file(tmp_path, monkeypatch):
+    """Redirect the engine cache into a temporary directory."""
+    cache_dir = tmp_path / "cache"
+    monkeypatch.setattr(SearchEngine, "CACHE_DIR", cache_dir)
+    monkeypatch.setattr(SearchEngine, "CACHE_FILE", cache_dir / "index.pkl")
+    return cache_dir / "index.pkl"
+
+
+class TestBuildWords:
+    """Test building Word objects from raw entries."""
+
+    SPECS = [
+        ("一心一意", "成语", " 专心 致志 ", "出处", None),
+        ("中国", "词语", "东亚国家", None, None),
+        ("意气风发", "成语", "精神振奋", None, None),
+    ]
+
+    def test_serial(self):
+        """Test entries are annotated in order."""
+        words = _build_words(self.SPECS, workers=1)
+        assert [w.word for w in words] == ["一心一意", "中国", "意气风发"]
+        assert words[0].definition == "专心 致志"
+        assert words[0].source == "出处"
+        assert words[1].pinyin_initials == "zg"
+
+    def test_parallel_matches_serial(self, monkeypatch):
+        """Test the process pool produces the same words, with shared chars."""
+        monkeypatch.setattr("lexicon.search.PARALLEL_BUILD_MIN", 0)
+        words = _build_words(self.SPECS, workers=2)
+        assert words == _build_words(self.SPECS, workers=1)
+        assert words[0].chars[3] is words[2].chars[0]
+
+    @pytest.mark.parametrize("error", [PermissionError("no semaphores"), BrokenProcessPool("worker died")])
+    def test_parallel_falls_back_to_serial(self, monkeypatch, error):
+        """Test a process pool that cannot start or breaks still builds every word."""
+        monkeypatch.setattr("lexicon.search.PARALLEL_BUILD_MIN", 0)
+        with patch("concurrent.futures.ProcessPoolExecutor", side_effect=error):
+            words = _build_words(self.SPECS, workers=2)
+        assert words == _build_words(self.SPECS, workers=1)
+
+
+class TestSearchEngineCache:
+    """Test loading data and the on-disk cache."""
+
+    def test_load_and_cache(self, data_dir, cache_file):
+        """Test a cold start loads JSON and writes the cache."""
+        engine = SearchEngine(str(data_dir))
+        assert [w.word for w in engine.words] == ["一心一意", "意气风发", "八仙过海", "中国"]
+        assert cache_file.exists()
+
+    def test_warm_start_uses_cache(self, data_dir, cache_file):
+        """Test a second engine loads from the cache without parsing JSON."""
+        SearchEngine(str(data_dir))
+        with patch.object(SearchEngine, "_load_data") as mock_load:
+            engine = SearchEngine(str(data_dir))
+        mock_load.assert_not_called()
+        assert len(engine.words) == 4
+        assert [w.word for w in engine.search(exact="中国")] == ["中国"]
+
+    def test_warm_start_loads_word_table(self, data_dir, cache_file):
+        """Test the cache stores words column-wise and reattaches them to the index."""
+        cold = SearchEngine(str(data_dir))
+        warm = SearchEngine(str(data_dir))
+        assert isinstance(warm.words, WordTable)
+        assert warm.index.words is warm.words
+        assert list(warm.words) == list(cold.words)
+
+    def test_cold_start_uses_word_table(self, data_dir, cache_file):
+        """Test a cold start also serves words from a WordTable."""
+        engine = SearchEngine(str(data_dir))
+        assert isinstance(engine.words, WordTable)
+        assert engine.index.words is engine.words
+
+    def test_cache_includes_pinyin_indexes(self, data_dir, cache_file):
+        """Test the lazy pinyin indexes are stored in the cache."""
+        SearchEngine(str(data_dir))
+        engine = SearchEngine(str(data_dir))
+        assert "by_char_pinyin" in vars(engine.index)
+        assert "中" in engine.index.by_char_pinyin["zhong"]
+
+    def test_cache_invalidated_on_data_change(self, data_dir, cache_file):
+        """Test the cache is rebuilt when a data file changes."""
+        import orjson
+
+        SearchEngine(str(data_dir))
+        (data_dir / "ci.json").write_bytes(orjson.dumps([
+            {"ci": "中国", "explanation": "东亚国家"},
+            {"ci": "天下", "explanation": "全世界"},
+        ]))
+        engine = SearchEngine(str(data_dir))
+        assert len(engine.words) == 5
+
+    def test_cache_invalidated_on_mtime_change(self, data_dir, cache_file):
+        """Test a same-size rewrite is detected through the modification time."""
+        import os
+
+        SearchEngine(str(data_dir))
+        ci_file = data_dir / "ci.json"
+        stat = ci_file.stat()
+        os.utime(ci_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        with patch.object(SearchEngine, "_load_data") as mock_load:
+            SearchEngine(str(data_dir))
+        mock_load.assert_called_once()
+
+    def test_compressed_cache(self, data_dir, cache_file, monkeypatch):
+        """Test LEXICON_CACHE_COMPRESS writes a compressed cache that loads back."""
+        monkeypatch.setenv("LEXICON_CACHE_COMPRESS", "1")
+        SearchEngine(str(data_dir))
+        assert not cache_file.read_bytes().startswith(b"\x80")
+        monkeypatch.delenv("LEXICON_CACHE_COMPRESS")
+        with patch.object(SearchEngine, "_load_data") as mock_load:
+            engine = SearchEngine(str(data_dir))
+        mock_load.assert_not_called()
+        assert len(engine.words) == 4
+
+    def test_failed_save_keeps_old_cache(self, data_dir, cache_file):
+        """Test an interrupted save leaves the previous cache and no temp files."""
+        SearchEngine(str(data_dir))
+        before = cache_file.read_bytes()
+        engine = SearchEngine(str(data_dir))
+        with patch("lexicon.search.pickle.dump", side_effect=OSError("disk full")):
+            engine._save_to_cache()
+        assert cache_file.read_bytes() == before
+        assert sorted(p.name for p in cache_file.parent.iterdir()) == ["index.pkl", "pinyin.json"]
+
+    def test_rebuild_reuses_pinyin_cache(self, data_dir, cache_file):
+        """Test a rebuild takes known words' pinyin from the pinyin cache."""
+        import orjson
+
+        SearchEngine(str(data_dir))
+        pinyin_file = cache_file.parent / "pinyin.json"
+        cache_data = orjson.loads(pinyin_file.read_bytes())
+        assert cache_data["annotations"]["中国"] == ["zhōng guó", "zhong guo", "zg", "1,2", "uo"]
+
+        # A rebuild that reads the cached entry back, not pypinyin's result
+        cache_data["annotations"]["中国"][0] = "cached"
+        pinyin_file.write_bytes(orjson.dumps(cache_data))
+        cache_file.unlink()
+        engine = SearchEngine(str(data_dir))
+        assert engine.search(exact="中国")[0].pinyin == "cached"
+
+    def test_pinyin_cache_invalidated_on_signature_change(self, data_dir, cache_file, monkeypatch):
+        """Test annotations saved under other rules are recomputed."""
+        SearchEngine(str(data_dir))
+        cache_file.unlink()
+        monkeypatch.setattr(SearchEngine, "ANNOTATION_CACHE_VERSION", SearchEngine.ANNOTATION_CACHE_VERSION + 1)
+        with patch.object(SearchEngine, "_save_annotation_cache") as mock_save:
+            SearchEngine(str(data_dir))
+        assert mock_save.call_args.args[0] == {}
+
+    def test_rehash_ignores_mtime(self, data_dir, cache_file, monkeypatch):
+        """Test LEXICON_REHASH keys the cache on file contents."""
+        import os
+
+        monkeypatch.setenv("LEXICON_REHASH", "1")
+        SearchEngine(str(data_dir))
+        ci_file = data_dir / "ci.json"
+        stat = ci_file.stat()
+        os.utime(ci_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        with patch.object(SearchEngine, "_load_data") as mock_load:
+            SearchEngine(str(data_dir))
+        mock_load.assert_not_called()